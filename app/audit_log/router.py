@@ -1,17 +1,14 @@
 from http import HTTPStatus
-from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from app.common import ilike_contains
 from app.database import get_db
 from app.models import AuditLog
-
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+from app.templating import templates
 
 router = APIRouter()
 page_router = APIRouter()
@@ -149,7 +146,7 @@ def list_audit_logs(
     if method:
         query = query.filter(AuditLog.method == method.upper().strip())
     if actor:
-        query = query.filter(AuditLog.admin_username.ilike(f"%{actor.strip()}%"))
+        query = query.filter(ilike_contains(AuditLog.admin_username, actor.strip()))
 
     total = query.count()
     rows = query.order_by(AuditLog.event_time_utc.desc()).offset(offset).limit(limit).all()
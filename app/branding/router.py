@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+import hashlib
+
+from fastapi import APIRouter, Request
 from starlette.responses import Response
 
 from app.config import settings
@@ -14,14 +16,14 @@ def _safe_hex_color(value: str, fallback: str) -> str:
 
 
 def _hex_to_rgb(hex_color: str) -> str:
-    h = hex_color.lstrip("#")
-    if len(h) != 6 or any(ch not in "0123456789abcdefABCDEF" for ch in h):
-        h = "206bc4"
-    return f"{int(h[0:2], 16)}, {int(h[2:4], 16)}, {int(h[4:6], 16)}"
+    try:
+        r, g, b = bytes.fromhex(hex_color.lstrip("#"))
+    except ValueError:
+        r, g, b = 0x20, 0x6B, 0xC4
+    return f"{r}, {g}, {b}"
 
 
-@router.get("/brand.css")
-async def brand_css():
+def _build_brand_css() -> bytes:
     p = _safe_hex_color(settings.BRAND_PRIMARY, "#206bc4")
     sidebar_bg = _safe_hex_color(settings.BRAND_SIDEBAR_BG, "#1b2434")
     sidebar_text = _safe_hex_color(settings.BRAND_SIDEBAR_TEXT, "#ffffff")
@@ -41,4 +43,18 @@ async def brand_css():
     --tblr-primary-rgb: {_hex_to_rgb(p)};
 }}
 """
-    return Response(content=css, media_type="text/css")
+    return css.encode("utf-8")
+
+
+# Settings are fixed for the lifetime of the process, so the stylesheet is
+# rendered once at import and served from memory.
+_CSS_BYTES = _build_brand_css()
+_ETAG = f'"{hashlib.md5(_CSS_BYTES, usedforsecurity=False).hexdigest()}"'
+_CACHE_HEADERS = {"ETag": _ETAG, "Cache-Control": "public, max-age=86400"}
+
+
+@router.get("/brand.css")
+async def brand_css(request: Request):
+    if request.headers.get("if-none-match") == _ETAG:
+        return Response(status_code=304, headers=_CACHE_HEADERS)
+    return Response(content=_CSS_BYTES, media_type="text/css", headers=_CACHE_HEADERS)
@@ -1,3 +1,5 @@
-from app.common.entity_ops import current_actor, mark_soft_deleted
+from app.common.entity_ops import current_actor, mark_soft_deleted, soft_delete_where
+from app.common.pagination import fetch_page
+from app.common.search import ilike_contains
 
-__all__ = ["current_actor", "mark_soft_deleted"]
+__all__ = ["current_actor", "fetch_page", "ilike_contains", "mark_soft_deleted", "soft_delete_where"]
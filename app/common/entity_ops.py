@@ -1,6 +1,8 @@
-from datetime import datetime, timezone
+from typing import Any
 
 from fastapi import Request
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
 
 
 def current_actor(request: Request) -> str:
@@ -12,5 +14,21 @@ def current_actor(request: Request) -> str:
 
 
 def mark_soft_deleted(entity: object, request: Request) -> None:
-    setattr(entity, "deleted_at", datetime.now(timezone.utc))
+    # Let the database stamp deleted_at, matching the server_default on created_at.
+    setattr(entity, "deleted_at", func.now())
     setattr(entity, "deleted_by", current_actor(request))
+
+
+def soft_delete_where(db: Session, model: Any, request: Request, *criteria: Any) -> int:
+    """Soft-delete live ``model`` rows matching ``criteria`` in one UPDATE.
+
+    Returns the number of rows affected, so callers can 404 on zero without
+    loading the row first.
+    """
+    result = db.execute(
+        update(model)
+        .where(model.deleted_at.is_(None), *criteria)
+        .values(deleted_at=func.now(), deleted_by=current_actor(request))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -0,0 +1,25 @@
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query
+
+
+def fetch_page(query: Query, offset: int, limit: int) -> tuple[list[Row[Any]], int]:
+    """Return one page of rows plus the total match count in a single round-trip.
+
+    The total rides along on every row as a ``COUNT(*) OVER ()`` window column,
+    so callers read their entities by name from each returned row. A separate
+    count is only issued when the page is empty but ``offset`` is past the start.
+    """
+    rows = (
+        query.add_columns(func.count().over().label("total_count"))
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    if rows:
+        return rows, rows[0].total_count
+    if offset:
+        return [], query.order_by(None).count()
+    return [], 0
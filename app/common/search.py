@@ -0,0 +1,18 @@
+from sqlalchemy import ColumnElement
+from sqlalchemy.orm import InstrumentedAttribute
+
+_LIKE_ESCAPE = "\\"
+
+
+def ilike_contains(column: InstrumentedAttribute, term: str) -> ColumnElement[bool]:
+    """Case-insensitive substring match that treats ``%`` and ``_`` in ``term`` literally.
+
+    Plain ``ILIKE`` (rather than ``lower() LIKE``) keeps the PostgreSQL trigram
+    indexes usable.
+    """
+    escaped = (
+        term.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2)
+        .replace("%", f"{_LIKE_ESCAPE}%")
+        .replace("_", f"{_LIKE_ESCAPE}_")
+    )
+    return column.ilike(f"%{escaped}%", escape=_LIKE_ESCAPE)
@@ -11,6 +11,10 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str = "sqlite:///./sqlite.db"
     DEBUG: bool = False
+    SQL_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
     ENABLE_AUTH: bool = Field(
         default=True,
         validation_alias=AliasChoices("ENABLE_AUTH", "AUTH_ENABLED"),
@@ -24,6 +28,7 @@ class Settings(BaseSettings):
     SCHEMA_SAMPLE_LIMIT: int = 10
     SCHEMA_INCLUDE_ROW_COUNTS: bool = True
     SCHEMA_EXPORT_MAX_ROWS: int = 5000
+    SCHEMA_CACHE_TTL_SECONDS: int = 30
 
     BRAND_PRIMARY: str = "#206bc4"
     BRAND_SIDEBAR_BG: str = "#1b2434"
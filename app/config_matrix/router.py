@@ -1,20 +1,16 @@
 from datetime import date, datetime
-from pathlib import Path
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 
-from app.common import mark_soft_deleted
+from app.common import fetch_page, soft_delete_where
 from app.database import get_db
 from app.models import Customer, CustomerConfigMatrix, CustomConfig, PresetConfig
 from app.schemas import ConfigSchema
-
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+from app.templating import templates
 
 router = APIRouter()
 page_router = APIRouter()
@@ -71,13 +67,38 @@ class ConfigMatrixListResponse(BaseModel):
 
 
 def _active_query(db: Session):
+    """Live matrix rows with only the related columns ``_to_out`` reads."""
     return (
         db.query(CustomerConfigMatrix)
         .options(
-            joinedload(CustomerConfigMatrix.customer),
-            joinedload(CustomerConfigMatrix.preset_config),
-            joinedload(CustomerConfigMatrix.custom_config),
+            joinedload(CustomerConfigMatrix.customer).load_only(Customer.name),
+            joinedload(CustomerConfigMatrix.preset_config).load_only(PresetConfig.name, PresetConfig.config),
+            joinedload(CustomerConfigMatrix.custom_config).load_only(CustomConfig.config),
+            raiseload("*"),
+        )
+        .filter(CustomerConfigMatrix.deleted_at.is_(None))
+    )
+
+
+def _list_query(db: Session):
+    """Flat column rows for list pages, so no ORM objects are hydrated."""
+    return (
+        db.query(
+            CustomerConfigMatrix.id,
+            CustomerConfigMatrix.customer_id,
+            Customer.name.label("customer_name"),
+            CustomerConfigMatrix.preset_config_id,
+            PresetConfig.name.label("preset_config_name"),
+            CustomerConfigMatrix.custom_config_id,
+            PresetConfig.config.label("preset_config"),
+            CustomConfig.config.label("custom_config"),
+            CustomerConfigMatrix.effective_from,
+            CustomerConfigMatrix.created_at,
+            CustomerConfigMatrix.updated_at,
         )
+        .outerjoin(Customer, Customer.id == CustomerConfigMatrix.customer_id)
+        .outerjoin(PresetConfig, PresetConfig.id == CustomerConfigMatrix.preset_config_id)
+        .outerjoin(CustomConfig, CustomConfig.id == CustomerConfigMatrix.custom_config_id)
         .filter(CustomerConfigMatrix.deleted_at.is_(None))
     )
 
@@ -105,6 +126,18 @@ def _to_out(m: CustomerConfigMatrix) -> ConfigMatrixOut:
     )
 
 
+_MATRIX_LIST_ADAPTER = TypeAdapter(list[ConfigMatrixOut])
+
+
+def _row_values(row) -> dict[str, Any]:
+    values = dict(row._mapping)
+    values.pop("total_count", None)
+    preset_config = values.pop("preset_config")
+    custom_config = values.pop("custom_config")
+    values["config"] = preset_config if preset_config is not None else custom_config
+    return values
+
+
 @router.get("", response_model=ConfigMatrixListResponse)
 def list_config_matrix(
     customer_id: str | None = Query(None, description="Filter by customer"),
@@ -115,7 +148,7 @@ def list_config_matrix(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ):
-    query = _active_query(db)
+    query = _list_query(db)
 
     if customer_id:
         query = query.filter(CustomerConfigMatrix.customer_id == customer_id)
@@ -131,11 +164,10 @@ def list_config_matrix(
     if custom_config_id is not None:
         query = query.filter(CustomerConfigMatrix.custom_config_id == custom_config_id)
 
-    total = query.count()
-    rows = query.order_by(CustomerConfigMatrix.effective_from.desc()).offset(offset).limit(limit).all()
+    rows, total = fetch_page(query.order_by(CustomerConfigMatrix.effective_from.desc()), offset, limit)
 
     return ConfigMatrixListResponse(
-        config_matrix=[_to_out(m) for m in rows],
+        config_matrix=_MATRIX_LIST_ADAPTER.validate_python([_row_values(row) for row in rows]),
         total=total,
     )
 
@@ -156,9 +188,8 @@ def create_config_matrix(body: ConfigMatrixCreate, db: Session = Depends(get_db)
     if not customer:
         raise HTTPException(status_code=404, detail="Customer not found")
 
-    custom_config_id = None
-
-    if body.preset_config_id:
+    preset = None
+    if body.preset_config_id is not None:
         preset = db.query(PresetConfig).filter(
             PresetConfig.id == body.preset_config_id, PresetConfig.deleted_at.is_(None)
         ).first()
@@ -180,28 +211,26 @@ def create_config_matrix(body: ConfigMatrixCreate, db: Session = Depends(get_db)
             detail="An assignment for this customer already exists on that effective date",
         )
 
-    if body.custom_config:
-        custom = CustomConfig(config=body.custom_config.model_dump())
-        db.add(custom)
-        db.flush()
-        custom_config_id = custom.id
+    custom = CustomConfig(config=body.custom_config.model_dump()) if body.custom_config else None
 
+    # Attach the already-loaded related rows so the response can be built
+    # from memory after flush instead of re-querying the joined entry.
     entry = CustomerConfigMatrix(
-        customer_id=body.customer_id,
-        preset_config_id=body.preset_config_id,
-        custom_config_id=custom_config_id,
+        customer=customer,
+        preset_config=preset,
+        custom_config=custom,
         effective_from=body.effective_from,
     )
     db.add(entry)
     try:
-        db.commit()
-        db.refresh(entry)
+        db.flush()
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=400, detail="Invalid config assignment")
 
-    m = _active_query(db).filter(CustomerConfigMatrix.id == entry.id).first()
-    return _to_out(m)
+    out = _to_out(entry)
+    db.commit()
+    return out
 
 
 @router.patch("/{matrix_id}", response_model=ConfigMatrixOut)
@@ -214,7 +243,7 @@ def update_config_matrix(
     if not m:
         raise HTTPException(status_code=404, detail="Config matrix entry not found")
 
-    updates = body.model_dump(exclude_unset=True)
+    updates = body.model_dump(include=body.model_fields_set)
 
     if "preset_config_id" in updates:
         if updates["preset_config_id"] is not None:
@@ -223,18 +252,15 @@ def update_config_matrix(
             ).first()
             if not preset:
                 raise HTTPException(status_code=404, detail="Preset config not found")
-            m.preset_config_id = updates["preset_config_id"]
-            m.custom_config_id = None
+            m.preset_config = preset
+            m.custom_config = None
 
     if "custom_config" in updates and updates["custom_config"] is not None:
         if m.custom_config:
-            m.custom_config.config = body.custom_config.model_dump()
+            m.custom_config.config = updates["custom_config"]
         else:
-            custom = CustomConfig(config=body.custom_config.model_dump())
-            db.add(custom)
-            db.flush()
-            m.custom_config_id = custom.id
-        m.preset_config_id = None
+            m.custom_config = CustomConfig(config=updates["custom_config"])
+        m.preset_config = None
 
     if "effective_from" in updates:
         proposed_effective_from = updates["effective_from"]
@@ -256,14 +282,14 @@ def update_config_matrix(
         m.effective_from = proposed_effective_from
 
     try:
-        db.commit()
-        db.refresh(m)
+        db.flush()
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=400, detail="Invalid config assignment state")
 
-    m = _active_query(db).filter(CustomerConfigMatrix.id == matrix_id).first()
-    return _to_out(m)
+    out = _to_out(m)
+    db.commit()
+    return out
 
 
 @router.delete("/{matrix_id}", status_code=204)
@@ -272,13 +298,6 @@ def delete_config_matrix(
     request: Request,
     db: Session = Depends(get_db),
 ):
-    m = (
-        db.query(CustomerConfigMatrix)
-        .filter(CustomerConfigMatrix.id == matrix_id, CustomerConfigMatrix.deleted_at.is_(None))
-        .first()
-    )
-    if not m:
+    if not soft_delete_where(db, CustomerConfigMatrix, request, CustomerConfigMatrix.id == matrix_id):
         raise HTTPException(status_code=404, detail="Config matrix entry not found")
-
-    mark_soft_deleted(m, request)
     db.commit()
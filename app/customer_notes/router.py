@@ -2,10 +2,10 @@ from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.common import mark_soft_deleted
+from app.common import fetch_page, soft_delete_where
 from app.database import get_db
 from app.models import Customer, CustomerNote
 
@@ -35,6 +35,9 @@ class NoteListResponse(BaseModel):
     total: int
 
 
+_NOTE_LIST_ADAPTER = TypeAdapter(list[NoteOut])
+
+
 def _active_query(db: Session, customer_id: str):
     return db.query(CustomerNote).filter(
         CustomerNote.customer_id == customer_id,
@@ -60,11 +63,12 @@ def list_notes(
 ):
     _get_customer_or_404(db, customer_id)
     query = _active_query(db, customer_id)
-    total = query.count()
-    notes = query.order_by(CustomerNote.created_at.desc()).offset(offset).limit(limit).all()
+    rows, total = fetch_page(query.order_by(CustomerNote.created_at.desc()), offset, limit)
 
     return NoteListResponse(
-        notes=[NoteOut.model_validate(n) for n in notes],
+        notes=_NOTE_LIST_ADAPTER.validate_python(
+            [row.CustomerNote for row in rows], from_attributes=True
+        ),
         total=total,
     )
 
@@ -107,9 +111,13 @@ def delete_note(
     request: Request,
     db: Session = Depends(get_db),
 ):
-    note = _active_query(db, customer_id).filter(CustomerNote.id == note_id).first()
-    if not note:
+    deleted = soft_delete_where(
+        db,
+        CustomerNote,
+        request,
+        CustomerNote.id == note_id,
+        CustomerNote.customer_id == customer_id,
+    )
+    if not deleted:
         raise HTTPException(status_code=404, detail="Note not found")
-
-    mark_soft_deleted(note, request)
     db.commit()
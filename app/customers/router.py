@@ -1,20 +1,16 @@
 from datetime import date, datetime
-from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
 from sqlalchemy import func, or_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.common import mark_soft_deleted
+from app.common import fetch_page, ilike_contains, soft_delete_where
 from app.database import get_db
 from app.models import AuditLog, Customer, CustomerConfigMatrix, CustomerNote
-
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+from app.templating import templates
 
 router = APIRouter()
 page_router = APIRouter()
@@ -76,6 +72,9 @@ class CustomerTimelineResponse(BaseModel):
     entries: list[CustomerTimelineItem]
 
 
+_CUSTOMER_LIST_ADAPTER = TypeAdapter(list[CustomerOut])
+
+
 def _active_query(db: Session):
     return db.query(Customer).filter(Customer.deleted_at.is_(None))
 
@@ -90,17 +89,17 @@ def list_customers(
     query = _active_query(db)
 
     if search:
-        pattern = f"%{search}%"
         query = query.filter(or_(
-            Customer.name.ilike(pattern),
-            Customer.email.ilike(pattern),
+            ilike_contains(Customer.name, search),
+            ilike_contains(Customer.email, search),
         ))
 
-    total = query.count()
-    customers = query.order_by(Customer.created_at.desc()).offset(offset).limit(limit).all()
+    rows, total = fetch_page(query.order_by(Customer.created_at.desc()), offset, limit)
 
     return CustomerListResponse(
-        customers=[CustomerOut.model_validate(c) for c in customers],
+        customers=_CUSTOMER_LIST_ADAPTER.validate_python(
+            [row.Customer for row in rows], from_attributes=True
+        ),
         total=total,
     )
 
@@ -255,9 +254,6 @@ def delete_customer(
     request: Request,
     db: Session = Depends(get_db),
 ):
-    customer = _active_query(db).filter(Customer.id == customer_id).first()
-    if not customer:
+    if not soft_delete_where(db, Customer, request, Customer.id == customer_id):
         raise HTTPException(status_code=404, detail="Customer not found")
-
-    mark_soft_deleted(customer, request)
     db.commit()
@@ -1,6 +1,6 @@
 from collections.abc import Generator
 
-from sqlalchemy import create_engine as sa_create_engine
+from sqlalchemy import create_engine as sa_create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -10,6 +10,15 @@ _engine: Engine | None = None
 _SessionLocal: sessionmaker | None = None
 
 
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 def create_engine() -> Engine:
     global _engine, _SessionLocal
 
@@ -19,11 +28,14 @@ def create_engine() -> Engine:
     if url.startswith("sqlite"):
         kwargs["connect_args"] = {"check_same_thread": False}
     else:
-        kwargs["pool_size"] = 5
-        kwargs["max_overflow"] = 10
+        kwargs["pool_size"] = settings.DB_POOL_SIZE
+        kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
         kwargs["pool_pre_ping"] = True
+        kwargs["pool_recycle"] = settings.DB_POOL_RECYCLE_SECONDS
 
-    _engine = sa_create_engine(url, echo=settings.DEBUG, **kwargs)
+    _engine = sa_create_engine(url, echo=settings.SQL_ECHO, query_cache_size=1200, **kwargs)
+    if url.startswith("sqlite"):
+        event.listen(_engine, "connect", _apply_sqlite_pragmas)
     _SessionLocal = sessionmaker(bind=_engine)
     return _engine
 
@@ -1,18 +1,16 @@
-from pathlib import Path
 import csv
 import io
+import time
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
-from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-from sqlalchemy import MetaData, Table, func, inspect as sa_inspect, select
+from sqlalchemy import MetaData, Table, func, inspect as sa_inspect, select, table
+from sqlalchemy.engine import Connection
 
 from app.config import settings
 from app.database import get_engine
-
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+from app.templating import templates
 
 router = APIRouter()
 
@@ -53,6 +51,21 @@ class SchemaResponse(BaseModel):
     total_columns: int
 
 
+# Keyed by whether row counts were included; values are (built_at, response).
+_schema_cache: dict[bool, tuple[float, SchemaResponse]] = {}
+
+
+def _count_rows(conn: Connection, table_names: list[str]) -> dict[str, int]:
+    """Count rows for every table in a single statement of scalar subqueries."""
+    if not table_names:
+        return {}
+    stmt = select(*(
+        select(func.count()).select_from(table(name)).scalar_subquery().label(f"t{i}")
+        for i, name in enumerate(table_names)
+    ))
+    return dict(zip(table_names, conn.execute(stmt).one()))
+
+
 @router.get("/api/schema", response_model=SchemaResponse)
 def get_schema(
     include_counts: bool | None = Query(
@@ -64,66 +77,71 @@ def get_schema(
         raise HTTPException(status_code=404, detail="Schema browser is disabled")
 
     counts_enabled = settings.SCHEMA_INCLUDE_ROW_COUNTS if include_counts is None else include_counts
+    cached = _schema_cache.get(counts_enabled)
+    if cached and time.monotonic() - cached[0] < settings.SCHEMA_CACHE_TTL_SECONDS:
+        return cached[1]
+
     engine = get_engine()
-    inspector = sa_inspect(engine)
-    metadata = MetaData()
     tables: list[TableInfo] = []
     total_rows = 0
     total_columns = 0
 
-    for table_name in sorted(inspector.get_table_names()):
-        columns = inspector.get_columns(table_name)
-        pk = inspector.get_pk_constraint(table_name)
-        fks = inspector.get_foreign_keys(table_name)
-        indexes = inspector.get_indexes(table_name)
-
-        pk_cols = set(pk.get("constrained_columns", []))
-        fk_map: dict[str, str] = {}
-        for fk in fks:
-            for i, col in enumerate(fk["constrained_columns"]):
-                ref_col = fk["referred_columns"][i]
-                fk_map[col] = f'{fk["referred_table"]}.{ref_col}'
-
-        row_count = 0
-        if counts_enabled:
-            table_ref = Table(table_name, metadata, autoload_with=engine)
-            with engine.connect() as conn:
-                row_count = conn.execute(select(func.count()).select_from(table_ref)).scalar()
-        total_rows += row_count
-        total_columns += len(columns)
-
-        enriched_columns = [
-            ColumnInfo(
-                name=col["name"],
-                type=str(col["type"]),
-                nullable=col.get("nullable", True),
-                default=col.get("default"),
-                is_pk=col["name"] in pk_cols,
-                fk_ref=fk_map.get(col["name"]),
-            )
-            for col in columns
-        ]
-
-        tables.append(TableInfo(
-            name=table_name,
-            columns=enriched_columns,
-            indexes=[
-                IndexInfo(
-                    name=idx.get("name"),
-                    column_names=idx.get("column_names", []),
-                    unique=idx.get("unique", False),
+    with engine.connect() as conn:
+        inspector = sa_inspect(conn)
+        table_names = sorted(inspector.get_table_names())
+        row_counts = _count_rows(conn, table_names) if counts_enabled else {}
+
+        for table_name in table_names:
+            columns = inspector.get_columns(table_name)
+            pk = inspector.get_pk_constraint(table_name)
+            fks = inspector.get_foreign_keys(table_name)
+            indexes = inspector.get_indexes(table_name)
+
+            pk_cols = set(pk.get("constrained_columns", []))
+            fk_map: dict[str, str] = {}
+            for fk in fks:
+                for i, col in enumerate(fk["constrained_columns"]):
+                    ref_col = fk["referred_columns"][i]
+                    fk_map[col] = f'{fk["referred_table"]}.{ref_col}'
+
+            row_count = row_counts.get(table_name, 0)
+            total_rows += row_count
+            total_columns += len(columns)
+
+            enriched_columns = [
+                ColumnInfo(
+                    name=col["name"],
+                    type=str(col["type"]),
+                    nullable=col.get("nullable", True),
+                    default=col.get("default"),
+                    is_pk=col["name"] in pk_cols,
+                    fk_ref=fk_map.get(col["name"]),
                 )
-                for idx in indexes
-            ],
-            row_count=row_count,
-        ))
-
-    return SchemaResponse(
+                for col in columns
+            ]
+
+            tables.append(TableInfo(
+                name=table_name,
+                columns=enriched_columns,
+                indexes=[
+                    IndexInfo(
+                        name=idx.get("name"),
+                        column_names=idx.get("column_names", []),
+                        unique=idx.get("unique", False),
+                    )
+                    for idx in indexes
+                ],
+                row_count=row_count,
+            ))
+
+    response = SchemaResponse(
         tables=tables,
         total_tables=len(tables),
         total_rows=total_rows,
         total_columns=total_columns,
     )
+    _schema_cache[counts_enabled] = (time.monotonic(), response)
+    return response
 
 
 def _serialise(value: object) -> object:
@@ -2,7 +2,6 @@ from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 import json
 import logging
-from pathlib import Path
 from urllib.parse import parse_qs
 
 from fastapi import FastAPI, Request
@@ -10,6 +9,7 @@ from fastapi.responses import PlainTextResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.concurrency import run_in_threadpool
 
 from app.auth_router import router as auth_router
 from app.audit_log.router import page_router as audit_log_page_router, router as audit_log_router
@@ -19,11 +19,10 @@ from app.config_matrix import page_router as matrix_page_router, router as confi
 from app.customer_notes import router as customer_notes_router
 from app.customers import page_router as customers_page_router, router as customers_router
 from app.database import create_engine, dispose_engine, get_session_factory
-from app.db_schema import router as schema_router
 from app.models import AdminUser, AuditLog
 from app.preset_configs import page_router as presets_page_router, router as preset_configs_router
+from app.templating import BASE_DIR, warm_templates
 
-BASE_DIR = Path(__file__).resolve().parent.parent
 logger = logging.getLogger(__name__)
 
 create_engine()
@@ -94,10 +93,28 @@ async def _parse_request_body(request: Request) -> dict:
     }
 
 
+def _load_active_admin(user_id) -> AdminUser | None:
+    session_factory = get_session_factory()
+    with session_factory() as db:
+        return (
+            db.query(AdminUser)
+            .filter(AdminUser.id == user_id, AdminUser.is_active.is_(True))
+            .first()
+        )
+
+
+def _persist_audit_row(audit_row: AuditLog) -> None:
+    session_factory = get_session_factory()
+    with session_factory() as db:
+        db.add(audit_row)
+        db.commit()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     if settings.ENABLE_AUTH and settings.SECRET_KEY == "change-me-in-production":
         logger.warning("ENABLE_AUTH is true while SECRET_KEY is using the default value.")
+    warm_templates()
     yield
     dispose_engine()
 
@@ -144,13 +161,8 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                     status_code=303,
                 )
 
-            session_factory = get_session_factory()
-            with session_factory() as db:
-                user = (
-                    db.query(AdminUser)
-                    .filter(AdminUser.id == user_id, AdminUser.is_active.is_(True))
-                    .first()
-                )
+            # The DB session is blocking, so keep it off the event loop.
+            user = await run_in_threadpool(_load_active_admin, user_id)
             if user is None:
                 request.session.clear()
                 if path.startswith("/api/"):
@@ -182,7 +194,6 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         finally:
             if should_audit:
                 try:
-                    session_factory = get_session_factory()
                     query_params = {}
                     for key in request.query_params.keys():
                         values = request.query_params.getlist(key)
@@ -205,9 +216,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                         user_agent=_truncate_text(request.headers.get("user-agent", ""), 512) or None,
                         error=_truncate_text(audit_error, 1000) if audit_error else None,
                     )
-                    with session_factory() as db:
-                        db.add(audit_row)
-                        db.commit()
+                    await run_in_threadpool(_persist_audit_row, audit_row)
                 except Exception:
                     # Never block application flow due to audit logging failures.
                     logger.exception(
@@ -247,6 +256,9 @@ app.include_router(customer_notes_router, prefix="/api/customers", tags=["custom
 app.include_router(preset_configs_router, prefix="/api/preset-configs", tags=["preset-configs"])
 app.include_router(config_matrix_router, prefix="/api/config-matrix", tags=["config-matrix"])
 if settings.ENABLE_SCHEMA_BROWSER:
+    # Only pay for importing the schema browser when it is actually mounted.
+    from app.db_schema import router as schema_router
+
     app.include_router(schema_router, tags=["schema"])
 
 
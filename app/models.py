@@ -2,7 +2,8 @@ import uuid
 from datetime import date, datetime
 from typing import Any
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, JSON, String, Text, func
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, Integer, JSON, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -10,6 +11,19 @@ class Base(DeclarativeBase):
     pass
 
 
+# Config blobs are stored as binary JSONB on PostgreSQL so reads skip re-parsing text.
+_CONFIG_JSON = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _active_index(name: str, *columns: str) -> Index:
+    """Index limited to live rows where the backend supports partial indexes.
+
+    MySQL has no partial indexes and gets a plain index on the same columns.
+    """
+    live = text("deleted_at IS NULL")
+    return Index(name, *columns, postgresql_where=live, sqlite_where=live)
+
+
 class AdminUser(Base):
     __tablename__ = "admin_users"
 
@@ -49,6 +63,7 @@ class AuditLog(Base):
 
 class Customer(Base):
     __tablename__ = "customers"
+    __table_args__ = (_active_index("idx_customers_active_created_at", "created_at"),)
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -73,6 +88,9 @@ class Customer(Base):
 
 class CustomerNote(Base):
     __tablename__ = "customer_notes"
+    __table_args__ = (
+        _active_index("idx_customer_notes_active_customer_created_at", "customer_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     customer_id: Mapped[str] = mapped_column(
@@ -93,10 +111,13 @@ class CustomerNote(Base):
 
 class PresetConfig(Base):
     __tablename__ = "preset_configs"
+    __table_args__ = (_active_index("idx_preset_configs_active_name", "name"),)
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself (RETURNING where supported).
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
-    config: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    config: Mapped[dict[str, Any]] = mapped_column(_CONFIG_JSON, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), nullable=False
     )
@@ -113,7 +134,7 @@ class CustomConfig(Base):
     __tablename__ = "custom_configs"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    config: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    config: Mapped[dict[str, Any]] = mapped_column(_CONFIG_JSON, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), nullable=False
     )
@@ -128,6 +149,14 @@ class CustomConfig(Base):
 
 class CustomerConfigMatrix(Base):
     __tablename__ = "customer_config_matrix"
+    __table_args__ = (
+        _active_index(
+            "idx_customer_config_matrix_active_customer_effective_from",
+            "customer_id",
+            "effective_from",
+        ),
+        _active_index("idx_customer_config_matrix_active_preset_config_id", "preset_config_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     customer_id: Mapped[str] = mapped_column(
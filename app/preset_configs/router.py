@@ -1,20 +1,17 @@
 from datetime import datetime
-from pathlib import Path
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only, raiseload
 
-from app.common import mark_soft_deleted
+from app.common import fetch_page, ilike_contains, mark_soft_deleted
 from app.database import get_db
 from app.models import Customer, CustomerConfigMatrix, PresetConfig
 from app.schemas import ConfigSchema
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+from app.templating import templates
 
 router = APIRouter()
 page_router = APIRouter()
@@ -56,8 +53,23 @@ class PresetConfigListResponse(BaseModel):
     total: int
 
 
+_PRESET_LIST_ADAPTER = TypeAdapter(list[PresetConfigOut])
+
+
 def _active_query(db: Session):
-    return db.query(PresetConfig).filter(PresetConfig.deleted_at.is_(None))
+    # Fail loudly on any relationship access instead of lazy-loading per row.
+    return (
+        db.query(PresetConfig)
+        .options(raiseload("*"))
+        .filter(PresetConfig.deleted_at.is_(None))
+    )
+
+
+def _get_preset_or_404(db: Session, preset_id: int) -> PresetConfig:
+    preset = db.get(PresetConfig, preset_id)
+    if preset is None or preset.deleted_at is not None:
+        raise HTTPException(status_code=404, detail="Preset config not found")
+    return preset
 
 
 @router.get("", response_model=PresetConfigListResponse)
@@ -67,13 +79,22 @@ def list_preset_configs(
     offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
 ):
-    query = _active_query(db)
+    # The list page renders each config, so only the soft-delete bookkeeping is skipped.
+    query = _active_query(db).options(
+        load_only(
+            PresetConfig.id,
+            PresetConfig.name,
+            PresetConfig.config,
+            PresetConfig.created_at,
+            PresetConfig.updated_at,
+        )
+    )
 
     if search:
-        query = query.filter(PresetConfig.name.ilike(f"%{search}%"))
+        query = query.filter(ilike_contains(PresetConfig.name, search))
 
-    total = query.count()
-    presets = query.order_by(PresetConfig.name).offset(offset).limit(limit).all()
+    rows, total = fetch_page(query.order_by(PresetConfig.name), offset, limit)
+    presets = [row.PresetConfig for row in rows]
 
     preset_ids = [p.id for p in presets]
     counts_by_preset: dict[int, int] = {}
@@ -100,26 +121,24 @@ def list_preset_configs(
         }
 
     return PresetConfigListResponse(
-        preset_configs=[
-            PresetConfigOut(
-                id=p.id,
-                name=p.name,
-                config=ConfigSchema(**p.config),
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-                customer_count=counts_by_preset.get(p.id, 0),
-            )
+        preset_configs=_PRESET_LIST_ADAPTER.validate_python([
+            {
+                "id": p.id,
+                "name": p.name,
+                "config": p.config,
+                "created_at": p.created_at,
+                "updated_at": p.updated_at,
+                "customer_count": counts_by_preset.get(p.id, 0),
+            }
             for p in presets
-        ],
+        ]),
         total=total,
     )
 
 
 @router.get("/{preset_id}", response_model=PresetConfigOut)
 def get_preset_config(preset_id: int, db: Session = Depends(get_db)):
-    preset = _active_query(db).filter(PresetConfig.id == preset_id).first()
-    if not preset:
-        raise HTTPException(status_code=404, detail="Preset config not found")
+    preset = _get_preset_or_404(db, preset_id)
     return PresetConfigOut.model_validate(preset)
 
 
@@ -128,12 +147,14 @@ def create_preset_config(body: PresetConfigCreate, db: Session = Depends(get_db)
     preset = PresetConfig(name=body.name, config=body.config.model_dump())
     db.add(preset)
     try:
-        db.commit()
-        db.refresh(preset)
+        db.flush()
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=409, detail="Preset name already exists")
-    return PresetConfigOut.model_validate(preset)
+
+    out = PresetConfigOut.model_validate(preset)
+    db.commit()
+    return out
 
 
 @router.patch("/{preset_id}", response_model=PresetConfigOut)
@@ -142,27 +163,25 @@ def update_preset_config(
     body: PresetConfigUpdate,
     db: Session = Depends(get_db),
 ):
-    preset = _active_query(db).filter(PresetConfig.id == preset_id).first()
-    if not preset:
-        raise HTTPException(status_code=404, detail="Preset config not found")
+    preset = _get_preset_or_404(db, preset_id)
 
-    updates = body.model_dump(exclude_unset=True)
+    # Only the top-level fields that were sent, but the nested config in full, in one dump.
+    updates = body.model_dump(include=body.model_fields_set)
     if not updates:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    if "config" in updates:
-        updates["config"] = body.config.model_dump()
-
     for field, value in updates.items():
         setattr(preset, field, value)
 
     try:
-        db.commit()
-        db.refresh(preset)
+        db.flush()
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=409, detail="Preset name already exists")
-    return PresetConfigOut.model_validate(preset)
+
+    out = PresetConfigOut.model_validate(preset)
+    db.commit()
+    return out
 
 
 @router.delete("/{preset_id}", status_code=204)
@@ -171,15 +190,15 @@ def delete_preset_config(
     request: Request,
     db: Session = Depends(get_db),
 ):
-    preset = _active_query(db).filter(PresetConfig.id == preset_id).first()
-    if not preset:
-        raise HTTPException(status_code=404, detail="Preset config not found")
+    preset = _get_preset_or_404(db, preset_id)
 
-    linked = db.query(CustomerConfigMatrix).filter(
+    links = db.query(CustomerConfigMatrix.id).filter(
         CustomerConfigMatrix.preset_config_id == preset_id,
         CustomerConfigMatrix.deleted_at.is_(None),
-    ).count()
-    if linked:
+    )
+    if links.limit(1).scalar() is not None:
+        # Only count the links when the delete is being rejected.
+        linked = links.count()
         raise HTTPException(
             status_code=409,
             detail=f"Cannot delete: preset is linked to {linked} customer{'s' if linked != 1 else ''}",
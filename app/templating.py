@@ -0,0 +1,17 @@
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+
+from app.config import settings
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Outside debug mode templates never change on disk, so skip the per-render mtime check.
+templates.env.auto_reload = settings.DEBUG
+
+
+def warm_templates() -> None:
+    """Compile every page template once so the first render of each skips parsing."""
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.get_template(name)
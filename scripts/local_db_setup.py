@@ -1,5 +1,7 @@
 """Initialize local database schema from SQLAlchemy models."""
 
+import argparse
+import logging
 import sys
 from pathlib import Path
 
@@ -7,13 +9,87 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateIndex, CreateTable
+
 from app.database import create_engine
 from app.models import Base
 
+logger = logging.getLogger(__name__)
+
+# PostgreSQL-only DDL the models cannot express portably. Trigram GIN indexes
+# let the leading-wildcard ILIKE searches use an index instead of a seq scan.
+# The DO block converts config columns created as json before the models used
+# JSONB, and is a no-op once they are jsonb.
+POSTGRES_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_customers_name_trgm ON customers USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_customers_email_trgm ON customers USING gin (email gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_preset_configs_name_trgm ON preset_configs USING gin (name gin_trgm_ops)",
+    """
+    DO $$
+    DECLARE target text;
+    BEGIN
+        FOREACH target IN ARRAY ARRAY['preset_configs', 'custom_configs'] LOOP
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = target AND column_name = 'config' AND data_type = 'json'
+            ) THEN
+                EXECUTE format('ALTER TABLE %I ALTER COLUMN config TYPE jsonb USING config::jsonb', target);
+            END IF;
+        END LOOP;
+    END $$
+    """,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Initialize the database schema.")
+    parser.add_argument(
+        "--sql",
+        action="store_true",
+        help="Print the DDL for the configured database instead of applying it",
+    )
+    return parser.parse_args()
+
+
+def print_ddl(engine: Engine) -> None:
+    for table in Base.metadata.sorted_tables:
+        print(f"{str(CreateTable(table).compile(dialect=engine.dialect)).strip()};")
+        for index in table.indexes:
+            print(f"{CreateIndex(index).compile(dialect=engine.dialect)};")
+    if engine.dialect.name == "postgresql":
+        for statement in POSTGRES_DDL:
+            print(f"{statement};")
+
 
 def main() -> None:
+    args = parse_args()
     engine = create_engine()
-    Base.metadata.create_all(bind=engine)
+    if args.sql:
+        print_ddl(engine)
+        return
+    # Create tables and model indexes in one transaction so a failed run leaves no
+    # partial schema on backends with transactional DDL.
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+        # create_all skips tables that already exist, so backfill indexes added
+        # to the models after a database was first initialised.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+    if engine.dialect.name == "postgresql":
+        # These are optional extras (CREATE EXTENSION needs privileges app roles
+        # often lack), so each runs on its own and a failure only warns.
+        for statement in POSTGRES_DDL:
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text(statement))
+            except DBAPIError as exc:
+                logger.warning("Skipped optional PostgreSQL setup statement: %s", exc.orig)
     print("Database schema initialized.")
     print(f"Connected database: {engine.url}")
 